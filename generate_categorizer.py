@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""
+Generate _categorizer_gen.py: CATEGORY_RULES from reorganize_samples.py unrolled into one function of literal
+`in` tests, checked in rule priority order. reorganize_samples.py uses it when present and up to date.
+Re-run after editing CATEGORY_RULES; a stale module is ignored.
+"""
+import argparse
+from pathlib import Path
+
+from reorganize_samples import CATEGORY_RULES, rules_digest
+
+HEADER = '''\
+# Generated by generate_categorizer.py from CATEGORY_RULES. Do not edit; re-run the generator instead.
+RULES_DIGEST = {digest!r}
+
+def match_rule(hay: bytes) -> int | None:
+    """Index of the first CATEGORY_RULES entry with a keyword in hay (lowercase ASCII bytes), or None."""
+'''
+
+def render(rules=CATEGORY_RULES) -> str:
+    lines = [HEADER.format(digest=rules_digest(rules))]
+    for idx, (keywords, target) in enumerate(rules):
+        # Rule order is priority order and must be kept; keywords within a rule may fall in any order
+        tests = " or ".join(f"{kw.encode('ascii')!r} in hay" for kw in dict.fromkeys(keywords))
+        lines.append(f"    if {tests}:  # {target}\n        return {idx}\n")
+    lines.append("    return None\n")
+    return "".join(lines)
+
+def main():
+    ap = argparse.ArgumentParser(description="Generate the specialized categorizer used by reorganize_samples.py.")
+    ap.add_argument("--output", type=Path, default=Path(__file__).with_name("_categorizer_gen.py"), help="Where to write the module")
+    args = ap.parse_args()
+    args.output.write_text(render())
+    print(f"Wrote {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,63 @@
 #!/usr/bin/env python3
 import argparse
+import errno
+import functools
 import os
 import re
 import shutil
 import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import hashlib
 
+try:
+    import ahocorasick  # optional: pip install pyahocorasick
+except ImportError:
+    ahocorasick = None
+
 MAX_REL_PATH_CHARS = 128
+# Worker threads for copy/symlink placement, and how many placements may be queued ahead of them
+WRITE_WORKERS = 8
+MAX_PENDING_WRITES = WRITE_WORKERS * 4
+# Per-file log lines written between stdout flushes
+LOG_FLUSH_LINES = 256
 FILLER_WORDS = {
     "the","and","with","from","for","of","loop","sample","one-shot","oneshot","onesht","shot",
     "stereo","mono","wet","dry","mix","ver","take","take1","take2","v1","v2","pack","splice"
 }
-SEPARATORS_RE = re.compile(r"[\s\-\._]+")
-NON_ALNUM_RE = re.compile(r"[^A-Za-z0-9\+\#]")
-VOWELS_RE = re.compile(r"(?i)(?<=.)([aeiouy])(?=.)")
-MULTI_UNDERSCORE_RE = re.compile(r"_+")
+
+class _NonAlnumTable(dict):
+    """str.translate table sending everything except ASCII letters, digits, '+' and '#' to '_', filled lazily."""
+    def __missing__(self, c: int):
+        ch = chr(c)
+        self[c] = out = c if ch.isascii() and (ch.isalnum() or ch in "+#") else "_"
+        return out
+
+# Name shortening runs on str.translate tables instead of chained regex passes.
+# Separators are whitespace (the same set as regex \s), "-", "." and "_"; str.isspace has nothing above U+3000.
+SEPARATORS_TRANS = {c: "_" for c in range(0x3001) if chr(c).isspace()} | {ord("-"): "_", ord("."): "_"}
+NON_ALNUM_TRANS = _NonAlnumTable()
+# Case-insensitive [aeiouy] also matches dotted and dotless I
+VOWELS_DELETE = str.maketrans("", "", "aeiouyAEIOUY\u0130\u0131")
 
 def _sha7(s: str) -> str:
     return hashlib.sha1(s.encode("utf-8")).hexdigest()[:7]
 
 def _collapse(name: str) -> str:
-    name = SEPARATORS_RE.sub("_", name.strip())
-    return MULTI_UNDERSCORE_RE.sub("_", name).strip("_")
+    return "_".join(t for t in name.translate(SEPARATORS_TRANS).split("_") if t)
 
 def _drop_filler(name: str) -> str:
     toks = [t for t in name.split("_") if t.lower() not in FILLER_WORDS]
     return "_".join(toks) or name
 
+def _strip_token_vowels(t: str) -> str:
+    # Keep the first and last character, drop vowels in between
+    return t[0] + t[1:-1].translate(VOWELS_DELETE) + t[-1] if len(t) > 2 else t
+
 def _mid_vowel_strip(name: str) -> str:
-    out = []
-    for t in name.split("_"):
-        out.append(VOWELS_RE.sub("", t))
-    s = "_".join(out)
-    return MULTI_UNDERSCORE_RE.sub("_", s).strip("_")
+    return "_".join(t for t in map(_strip_token_vowels, name.split("_")) if t)
 
 def _unique(suggested: str, existing: set[str], max_len: int, orig: str) -> str:
     cand = suggested[:max_len]
@@ -43,39 +66,89 @@ def _unique(suggested: str, existing: set[str], max_len: int, orig: str) -> str:
     suffix = "~" + _sha7(orig)
     room = max_len - len(suffix)
     if room < 1:
-        return suffix[-max_len:]
-    base = cand[:room]
-    final = base + suffix
-    if final in existing:
-        final = (orig[:max(1, room-1)] + suffix)[:max_len]
+        final = suffix[-max_len:]
+    else:
+        final = cand[:room] + suffix
+        if final in existing:
+            final = (orig[:max(1, room-1)] + suffix)[:max_len]
+    # The same name arriving from several packs hashes to the same suffix, so keep probing with a counter
+    i = 1
+    while final in existing:
+        i += 1
+        tag = f"{suffix}-{i}"
+        final = (cand[:max(0, max_len - len(tag))] + tag)[-max_len:]
     return final
 
 def _shorten_folder(name: str, max_len: int = 18) -> str:
     n = _mid_vowel_strip(_drop_filler(_collapse(name)))
     return (n or "x")[:max_len]
 
+@functools.lru_cache(maxsize=1024)
+def _pack_prefix(pack_hint: str) -> tuple[str, int]:
+    """Collapsed, lowercased pack hint and its collapsed length. Every file in a pack shares one hint."""
+    ph = _collapse(pack_hint)
+    return ph.lower(), len(ph)
+
 def _shorten_stem(stem: str, pack_hint: str | None) -> str:
     s = _collapse(stem)
     if pack_hint:
-        ph = _collapse(pack_hint)
+        ph_low, ph_len = _pack_prefix(pack_hint)
         low = s.lower()
-        if low.startswith(ph.lower() + "_"):
-            s = s[len(ph) + 1:]
-        elif low.startswith(ph.lower()):
-            s = s[len(ph):]
-    s = _mid_vowel_strip(_drop_filler(s))
-    s = NON_ALNUM_RE.sub("_", s)
-    s = MULTI_UNDERSCORE_RE.sub("_", s).strip("_")
-    return s or "x"
-
-def enforce_m8_limit(dst_root: Path, out_path: Path, pack_hint: str | None = None) -> Path:
-    """Return a possibly adjusted out_path so that its relative path length <= 128."""
-    rel = out_path.relative_to(dst_root)
-    if len(str(rel)) <= MAX_REL_PATH_CHARS:
+        if low.startswith(ph_low):
+            if low.startswith("_", len(ph_low)):
+                s = s[ph_len + 1:]
+            else:
+                s = s[ph_len:]
+    # Drop fillers, strip vowels, map non-alphanumerics and collapse underscores with one split and one join
+    toks = s.split("_")
+    toks = [t for t in toks if t.lower() not in FILLER_WORDS] or toks
+    s = "_".join(map(_strip_token_vowels, toks)).translate(NON_ALNUM_TRANS)
+    return "_".join(t for t in s.split("_") if t) or "x"
+
+# Destination folder -> names of files in it. Listed once per folder, then kept current by safe_write.
+# This assumes the process owns dest for the duration of a run: nothing else adds or removes files there.
+# main clears it at the start of each run; other callers should clear it whenever dest may have changed.
+_SIBLINGS_CACHE: dict[Path, set[str]] = {}
+
+def _siblings(folder: Path, create: bool = False) -> set[str]:
+    """
+    Known file names in folder. With create, a missing folder is made and starts empty without a listing.
+    Without it, a missing folder has no names and is not cached.
+    """
+    names = _SIBLINGS_CACHE.get(folder)
+    if names is not None:
+        return names
+    if create:
+        try:
+            folder.mkdir(parents=True)
+        except FileExistsError:
+            pass
+        else:
+            names = _SIBLINGS_CACHE[folder] = set()
+            return names
+    try:
+        with os.scandir(folder) as it:
+            names = {e.name for e in it if e.is_file()}
+    except FileNotFoundError:
+        return set()
+    _SIBLINGS_CACHE[folder] = names
+    return names
+
+def _root_len(dst_root: Path) -> int:
+    """Length of dst_root as a string, without a trailing separator, for relative length arithmetic."""
+    return len(str(dst_root).rstrip(os.sep))
+
+def enforce_m8_limit(dst_root_len: int, out_path: Path, pack_hint: str | None = None) -> Path:
+    """
+    Return a possibly adjusted out_path so that its relative path length <= 128.
+    dst_root_len is _root_len(dst_root); relative lengths are derived from it without building relative paths.
+    """
+    rel_len = len(str(out_path)) - dst_root_len - 1
+    if rel_len <= MAX_REL_PATH_CHARS:
         return out_path
 
     parent = out_path.parent
-    parent_rel_len = len(str(parent.relative_to(dst_root)))
+    parent_rel_len = len(str(parent)) - dst_root_len - 1
     max_name_len = MAX_REL_PATH_CHARS - parent_rel_len - 1
 
     stem = _shorten_stem(out_path.stem, pack_hint)
@@ -84,8 +157,15 @@ def enforce_m8_limit(dst_root: Path, out_path: Path, pack_hint: str | None = Non
     if len(stem) > max_stem_len:
         stem = stem[:max_stem_len]
 
-    siblings = {p.name for p in parent.iterdir() if p.is_file()}
-    new_name = _unique(stem + ext, siblings - {out_path.name}, max_name_len, out_path.name)
+    # The original name may be taken already; exclude it in place rather than copying the whole sibling set
+    siblings = _siblings(parent)
+    had_orig = out_path.name in siblings
+    siblings.discard(out_path.name)
+    try:
+        new_name = _unique(stem + ext, siblings, max_name_len, out_path.name)
+    finally:
+        if had_orig:
+            siblings.add(out_path.name)
     return parent / new_name
 
 # File types to include
@@ -138,78 +218,262 @@ CATEGORY_RULES = [
     (("loop",), "Loops/Misc"),
     (("one shot", "oneshot", "shot"), "One Shots/Misc"),
 ]
+# Intern category names so every path built from them shares one string object
+CATEGORY_RULES = [(keywords, sys.intern(target)) for keywords, target in CATEGORY_RULES]
+
+def _build_automaton():
+    """Compile every rule keyword into one Aho-Corasick automaton, keyed to its rule index."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for idx, (keywords, target) in enumerate(CATEGORY_RULES):
+        for kw in keywords:
+            # A keyword listed under several rules keeps its earliest (highest priority) rule
+            if kw not in automaton:
+                automaton.add_word(kw, (idx, target))
+    automaton.make_automaton()
+    return automaton
+
+RULES_AUTOMATON = _build_automaton()
+
+def rules_digest(rules=CATEGORY_RULES) -> str:
+    """Fingerprint of the rule table, used to tell whether a generated categorizer is stale."""
+    return hashlib.sha1(repr([(tuple(kws), cat) for kws, cat in rules]).encode("utf-8")).hexdigest()
+
+# Optional categorizer specialized from CATEGORY_RULES by generate_categorizer.py; ignored once the rules change
+try:
+    import _categorizer_gen
+except ImportError:
+    _categorizer_gen = None
+if _categorizer_gen is not None and getattr(_categorizer_gen, "RULES_DIGEST", None) != rules_digest():
+    _categorizer_gen = None
+
+def _keyword_priorities() -> dict[bytes, int]:
+    """Map each keyword, as ASCII bytes, to the index of the first rule that lists it."""
+    prio: dict[bytes, int] = {}
+    for idx, (keywords, _target) in enumerate(CATEGORY_RULES):
+        for kw in keywords:
+            prio.setdefault(kw.encode("ascii"), idx)
+    return prio
+
+# Regex fallback when pyahocorasick is unavailable: every keyword in one alternation, mapped back to its rule.
+# It runs on ASCII bytes, which skips Unicode lowercasing and Unicode-aware matching.
+KW_TO_PRIORITY = _keyword_priorities()
+# Alternatives are listed in rule priority order (not by length) so that at any position the highest priority
+# keyword wins, e.g. "bass" over "bassoon". The lookahead makes findall report a hit at every start position,
+# so overlapping keywords are not swallowed by an earlier, lower priority match.
+MEGA_RE = re.compile(b"(?=(" + b"|".join(map(re.escape, KW_TO_PRIORITY)) + b"))")
 
 # Simple helpers
-BPM_PAT = re.compile(r"\b(\d{2,3})\s?bpm\b", re.I)
-KEY_PAT = re.compile(r"\b([A-G](?:#|b)?)(?:\s|-|_)?(maj|min|m|minor|major)?\b", re.I)
+# BPM and key tags in one pattern, so each file name is scanned once
+TAG_PAT = re.compile(
+    r"\b(?P<bpm>\d{2,3})\s?bpm\b"
+    r"|\b(?P<key>[A-G](?:#|b)?)(?:\s|-|_)?(?P<qual>maj|min|m|minor|major)?\b",
+    re.I,
+)
 
 def norm(s: str) -> str:
     return s.lower()
 
+def norm_bytes(s: str) -> bytes:
+    # Keywords are ASCII; other characters become "?" so dropping them cannot join neighbours into a false match
+    return s.encode("ascii", "replace").lower()
+
+def _match_rule(hay: str) -> int | None:
+    """Index of the first CATEGORY_RULES entry with a keyword in hay (any case), or None."""
+    if RULES_AUTOMATON is not None:
+        # One pass over hay; the lowest rule index among all hits is the first rule that would have matched
+        return min((idx for _, (idx, _target) in RULES_AUTOMATON.iter(norm(hay))), default=None)
+    return min(map(KW_TO_PRIORITY.__getitem__, MEGA_RE.findall(norm_bytes(hay))), default=None)
+
+@functools.lru_cache(maxsize=8192)
+def _parent_rule(parent: Path) -> int | None:
+    """Rule matched by a folder and its ancestors, shared by every sample in that folder."""
+    hay = " ".join(p.name for p in (parent, *parent.parents) if p.name)  # includes pack and subfolders
+    # The generated ladder only beats the regex on long haystacks like this one; short file names use _match_rule
+    if RULES_AUTOMATON is None and _categorizer_gen is not None:
+        return _categorizer_gen.match_rule(norm_bytes(hay))
+    return _match_rule(hay)
+
 def categorize(path: Path) -> str:
     """
     Decide a category path for a sample based on filename and its parent folders.
     """
-    hay = " ".join([
-        path.name,
-        *[p.name for p in path.parents if p.name]  # includes pack and subfolders
-    ])
-    hay_n = norm(hay)
-
-    # Try explicit rules
-    for keywords, target in CATEGORY_RULES:
-        for kw in keywords:
-            if kw in hay_n:
-                return target
-
-    # Fallback heuristics
-    if "loop" in hay_n:
-        return "Loops/Misc"
-    return "Unsorted"
-
-def safe_write(src: Path, dest: Path, mode: str, dst_root: Path, enforce_limit: bool = True, pack_hint: str | None = None) -> Path:
+    # The file name and its folders are matched separately and the higher priority rule wins. This equals matching
+    # the joined string, since no keyword can span the extension at the end of the name and the folder after it.
+    rule = _match_rule(path.name)
+    parent_rule = _parent_rule(path.parent)
+    if parent_rule is not None and (rule is None or parent_rule < rule):
+        rule = parent_rule
+
+    # The generic "loop" rule is last in CATEGORY_RULES, so no separate fallback is needed
+    if rule is None:
+        return "Unsorted"
+    return CATEGORY_RULES[rule][1]
+
+def claim_dest(dest: Path, dst_root: Path, enforce_limit: bool = True, pack_hint: str | None = None) -> Path:
     """
-    Place file at dest using mode: move, copy, symlink.
+    Choose the final path for a file headed to dest and reserve its name, without placing the file.
     Enforce M8 128-char relative path limit and ensure uniqueness without exceeding it.
     """
-    dest.parent.mkdir(parents=True, exist_ok=True)
+    # Create the folder if needed; enforce_m8_limit then finds its listing cached
+    siblings = _siblings(dest.parent, create=True)
+
+    dst_root_len = _root_len(dst_root)
 
     # Optionally enforce the 128-char limit for the target filename before checking collisions
     if enforce_limit:
-        dest = enforce_m8_limit(dst_root, dest, pack_hint)
+        dest = enforce_m8_limit(dst_root_len, dest, pack_hint)
 
     # Ensure uniqueness among siblings without creating names that would exceed the limit
-    siblings = {p.name for p in dest.parent.iterdir() if p.is_file()}
-    # Compute the max filename length allowed given the parent relative path length
-    parent_rel_len = len(str(dest.parent.relative_to(dst_root)))
-    max_name_len = MAX_REL_PATH_CHARS - parent_rel_len - 1
-
-    stem, ext = dest.stem, dest.suffix
-    # Use the _unique helper to avoid collisions while respecting max_name_len
-    final_name = _unique(stem + ext, siblings, max_name_len, dest.name)
-    final = dest.parent / final_name
-
+    final_name = dest.name
+    # With the limit enforced the name already fits, so a free name needs no further work
+    if final_name in siblings or not enforce_limit:
+        # Compute the max filename length allowed given the parent relative path length
+        parent_rel_len = len(str(dest.parent)) - dst_root_len - 1
+        max_name_len = MAX_REL_PATH_CHARS - parent_rel_len - 1
+
+        stem, ext = dest.stem, dest.suffix
+        # Use the _unique helper to avoid collisions while respecting max_name_len
+        final_name = _unique(stem + ext, siblings, max_name_len, dest.name)
+    # Claim the name before placing the file so later collisions see it
+    siblings.add(final_name)
+    return dest.parent / final_name
+
+# copy_file_range errors that mean "not possible here", as opposed to a real I/O failure
+_COPY_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+
+def _fast_copy(src: Path, dst: Path) -> None:
+    """
+    Copy src to dst with metadata, like shutil.copy2, but let the kernel move the data with os.copy_file_range
+    where available (a reflink on copy-on-write filesystems). Falls back to a 1 MiB buffered copy.
+    """
+    copy_range = getattr(os, "copy_file_range", None)
+    if copy_range is None:
+        shutil.copy2(str(src), str(dst))
+        return
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        copied = 0
+        try:
+            while n := copy_range(fsrc.fileno(), fdst.fileno(), 1 << 30):
+                copied += n
+        except OSError as e:
+            if copied or e.errno not in _COPY_RANGE_UNSUPPORTED:
+                raise
+        # Some filesystems (FUSE, network mounts, cross-filesystem on some kernels) report 0 instead of an
+        # error without copying anything. Finish from the current offsets whenever less than the source arrived.
+        if copied < os.fstat(fsrc.fileno()).st_size:
+            shutil.copyfileobj(fsrc, fdst, 1 << 20)
+    shutil.copystat(str(src), str(dst))
+
+def place_file(src: Path, final: Path, mode: str) -> None:
+    """
+    Place src at final using mode: move, copy, symlink. Touches no shared state, so it is safe in worker threads.
+    Symlinks point at src as given when it is absolute; it is not resolved further.
+    """
     if mode == "move":
         shutil.move(str(src), str(final))
     elif mode == "copy":
-        shutil.copy2(str(src), str(final))
+        _fast_copy(src, final)
     elif mode == "symlink":
         try:
-            final.symlink_to(src.resolve())
+            # main passes paths under the already resolved source root; only resolve relative ones
+            final.symlink_to(src if src.is_absolute() else src.resolve())
         except Exception:
             # Try hardlink
             try:
                 os.link(src, final)
             except Exception:
-                shutil.copy2(str(src), str(final))
+                _fast_copy(src, final)
     else:
         raise ValueError("Unknown mode")
+
+def safe_write(src: Path, dest: Path, mode: str, dst_root: Path, enforce_limit: bool = True, pack_hint: str | None = None) -> Path:
+    """
+    Place file at dest using mode: move, copy, symlink.
+    Enforce M8 128-char relative path limit and ensure uniqueness without exceeding it.
+    """
+    final = claim_dest(dest, dst_root, enforce_limit, pack_hint)
+    place_file(src, final, mode)
     return final
 
+def _walk_scandir(root: Path, exts: tuple[str, ...]):
+    """
+    Yield os.DirEntry objects for files under root whose name ends with one of exts (lowercase, with dot).
+    Walks directories depth first in the same order as Path.rglob, without following directory symlinks.
+    """
+    stack = [str(root)]
+    while stack:
+        top = stack.pop()
+        try:
+            with os.scandir(top) as it:
+                entries = list(it)
+        except (PermissionError, NotADirectoryError):
+            # Like rglob: skip unreadable folders, and yield nothing when root is a file
+            continue
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subdirs.append(entry.path)
+                continue
+            low = entry.name.lower()
+            # A bare ".wav" has no suffix as far as Path.suffix is concerned, so it is not a sample
+            if low.endswith(exts) and low not in exts and entry.is_file():
+                yield entry
+        stack.extend(reversed(subdirs))
+
 def scan_files(root: Path):
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in AUDIO_EXTS:
-            yield p
+    for entry in _walk_scandir(root, tuple(AUDIO_EXTS)):
+        yield Path(entry.path)
+
+def dest_for(f: Path, src_root: Path, dst_root: Path) -> tuple[Path, str | None]:
+    """Destination path for source file f, tagged with bpm and key, and the pack hint used to shorten it."""
+    cat = categorize(f)
+
+    # Build filename with optional bpm and key tags for readability
+    name = f.stem
+    suffix = f.suffix
+
+    bpm = None
+    key = None
+    for m in TAG_PAT.finditer(f.name):
+        if m.group("bpm"):
+            if bpm is None:
+                bpm = m.group("bpm")
+        elif key is None:
+            # Keep letter uppercase, preserve sharps, and render flats with lowercase 'b' suffix
+            raw = m.group("key")
+            letter = raw[0].upper()
+            accidental = raw[1:] if len(raw) > 1 else ""
+            if accidental in {"#", "b"}:
+                base = f"{letter}{accidental}"
+            else:
+                base = letter
+            qual = (m.group("qual") or "").lower()
+            if qual in {"m", "min", "minor"}:
+                key = f"{base}m"
+            else:
+                key = base
+        if bpm is not None and key is not None:
+            break
+
+    tags = []
+    if bpm:
+        tags.append(f"{bpm}bpm")
+    if key:
+        tags.append(key)
+    tag_str = f" [{' '.join(tags)}]" if tags else ""
+
+    # Derive pack/vendor from the source path under src_root for better filename shortening
+    try:
+        rel_from_src = f.relative_to(src_root)
+        pack_hint = sys.intern(rel_from_src.parts[0]) if len(rel_from_src.parts) > 1 else None
+    except Exception:
+        pack_hint = None
+
+    rel_name = f"{name}{tag_str}{suffix}"
+    out_path = dst_root / cat / rel_name
+    return out_path, pack_hint
 
 def main():
     ap = argparse.ArgumentParser(description="Reorganize Splice packs into type-based folders.")
@@ -230,67 +494,76 @@ def main():
 
     extra_exts = {".mid", ".midi", ".als", ".adg", ".fxp", ".nki"} if args.include_non_audio else set()
     exts = AUDIO_EXTS | extra_exts
+    exts_tuple = tuple(exts)
+
+    # Destination listings from an earlier run in this process may be stale
+    _SIBLINGS_CACHE.clear()
+
+    # Copies and links are I/O bound and independent, so overlap them in a thread pool. Names are still
+    # claimed in order on this thread, keeping collision handling deterministic. Moves stay serial.
+    pool = None
+    if not args.dry_run and args.mode != "move":
+        pool = ThreadPoolExecutor(max_workers=WRITE_WORKERS)
+    pending = deque()
+
+    # Per-file log lines go through a block-buffered stdout, even on a terminal, instead of one flush per print.
+    # They are flushed every LOG_FLUSH_LINES lines so progress stays visible, and at the end of the run.
+    out = sys.stdout
+    line_buffering = getattr(out, "line_buffering", False) and hasattr(out, "reconfigure")
+    if line_buffering:
+        out.reconfigure(line_buffering=False)
+    logged = 0
+
+    def log(line: str) -> None:
+        nonlocal logged
+        out.write(line)
+        logged += 1
+        if logged % LOG_FLUSH_LINES == 0:
+            out.flush()
 
     moved = 0
-    for f in src_root.rglob("*"):
-        if not f.is_file():
-            continue
-        if f.suffix.lower() not in exts:
-            continue
-
-        cat = categorize(f)
-
-        # Build filename with optional bpm and key tags for readability
-        name = f.stem
-        suffix = f.suffix
-
-        bpm = None
-        key = None
-        m_bpm = BPM_PAT.search(f.name)
-        if m_bpm:
-            bpm = m_bpm.group(1)
-
-        m_key = KEY_PAT.search(f.name)
-        if m_key:
-            # Keep letter uppercase, preserve sharps, and render flats with lowercase 'b' suffix
-            raw = m_key.group(1)
-            letter = raw[0].upper()
-            accidental = raw[1:] if len(raw) > 1 else ""
-            if accidental in {"#", "b"}:
-                base = f"{letter}{accidental}"
-            else:
-                base = letter
-            qual = (m_key.group(2) or "").lower()
-            if qual in {"m", "min", "minor"}:
-                key = f"{base}m"
+    try:
+        for entry in _walk_scandir(src_root, exts_tuple):
+            f = Path(entry.path)
+            out_path, pack_hint = dest_for(f, src_root, dst_root)
+
+            if args.dry_run:
+                if not args.quiet:
+                    log(f"{f}  ->  {out_path}  [{args.mode}]\n")
+            elif pool is None:
+                final_path = safe_write(f, out_path, args.mode, dst_root, True, pack_hint)
+                if not args.quiet:
+                    log(f"Placed: {final_path}\n")
             else:
-                key = base
-
-        tags = []
-        if bpm:
-            tags.append(f"{bpm}bpm")
-        if key:
-            tags.append(key)
-        tag_str = f" [{' '.join(tags)}]" if tags else ""
-
-        # Derive pack/vendor from the source path under src_root for better filename shortening
-        try:
-            rel_from_src = f.relative_to(src_root)
-            pack_hint = rel_from_src.parts[0] if len(rel_from_src.parts) > 1 else None
-        except Exception:
-            pack_hint = None
-
-        rel_name = f"{name}{tag_str}{suffix}"
-        out_path = dst_root / cat / rel_name
-
-        if args.dry_run:
-            if not args.quiet:
-                print(f"{f}  ->  {out_path}  [{args.mode}]")
-        else:
-            final_path = safe_write(f, out_path, args.mode, dst_root, True, pack_hint)
+                final_path = claim_dest(out_path, dst_root, True, pack_hint)
+                pending.append((pool.submit(place_file, f, final_path, args.mode), final_path))
+                if len(pending) >= MAX_PENDING_WRITES:
+                    future, final_path = pending.popleft()
+                    future.result()
+                    if not args.quiet:
+                        log(f"Placed: {final_path}\n")
+            moved += 1
+
+        while pending:
+            future, final_path = pending.popleft()
+            future.result()
             if not args.quiet:
-                print(f"Placed: {final_path}")
-        moved += 1
+                log(f"Placed: {final_path}\n")
+    except BaseException:
+        if pool is not None:
+            # Stop queued placements, wait for running ones, and log those that landed before re-raising
+            pool.shutdown(cancel_futures=True)
+            for future, final_path in pending:
+                if not future.cancelled() and future.exception() is None and not args.quiet:
+                    log(f"Placed: {final_path}\n")
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown()
+        # Flush before any traceback is printed, and give stdout back as we found it
+        out.flush()
+        if line_buffering:
+            out.reconfigure(line_buffering=True)
 
     if not args.quiet:
         action = "Would process" if args.dry_run else "Processed"